@@ -10,6 +10,7 @@ import {
   getMandatoryCTAFromBasicBrief,
   hasReferenceAsset
 } from "../services/brand-brief";
+import { parseJsonObject } from "../utils/json-extract";
 
 const AD_CONFIGS = {
   facebook_ad: {
@@ -119,8 +120,7 @@ Format output as JSON:
       temperature: 0.8,
     });
 
-    const jsonMatch = response.match(/\{[\s\S]*\}/);
-    const adData = jsonMatch ? JSON.parse(jsonMatch[0]) : { variations: [] };
+    const adData = parseJsonObject(response) ?? { variations: [] };
 
     let imageDataUrl: string | undefined;
     
@@ -205,15 +205,15 @@ Format output as JSON:
 
 export async function generateAllAdCopy(
   topic: ContentTopic,
-  brief: ClientBrief | EnrichedClientBrief
+  brief: ClientBrief | EnrichedClientBrief,
+  platforms: ('facebook_ad' | 'google_ad')[] = ['facebook_ad', 'google_ad']
 ): Promise<AgentResponse<GeneratedContent[]>> {
   try {
-    const [facebookResult, googleResult] = await Promise.all([
-      generateAdCopy(topic, brief, 'facebook_ad'),
-      generateAdCopy(topic, brief, 'google_ad'),
-    ]);
+    const results = await Promise.all(
+      platforms.map(platform => generateAdCopy(topic, brief, platform))
+    );
 
-    const successfulAds = [facebookResult, googleResult]
+    const successfulAds = results
       .filter(r => r.success && r.data)
       .map(r => r.data as GeneratedContent);
 
@@ -1,6 +1,7 @@
 import { generateWithClaude } from "../integrations/anthropic";
 import type { GeneratedContent, QAResult, AgentResponse, EnrichedClientBrief, ClientBrief } from "../types";
 import { buildQAValidationCriteria, formatTextualBriefForPrompt } from "../services/brand-brief";
+import { parseJsonObject } from "../utils/json-extract";
 
 function buildQASystemPrompt(brief?: EnrichedClientBrief): string {
   const brandCriteria = brief ? buildQAValidationCriteria(brief) : '';
@@ -95,13 +96,11 @@ Output as JSON:
       temperature: 0.3,
     });
 
-    const jsonMatch = response.match(/\{[\s\S]*\}/);
-    if (!jsonMatch) {
+    const qaResult = parseJsonObject<QAResult>(response);
+    if (!qaResult) {
       throw new Error("Failed to parse QA result JSON");
     }
 
-    const qaResult: QAResult = JSON.parse(jsonMatch[0]);
-
     return {
       success: true,
       data: qaResult,
@@ -152,9 +151,18 @@ export function calculateOverallScore(results: QAResult[]): {
   totalPassed: number;
   totalFailed: number;
 } {
-  const totalPassed = results.filter(r => r.passed).length;
+  if (results.length === 0) {
+    return { averageScore: 0, passRate: 0, totalPassed: 0, totalFailed: 0 };
+  }
+
+  let totalPassed = 0;
+  let scoreSum = 0;
+  for (const r of results) {
+    if (r.passed) totalPassed++;
+    scoreSum += r.score;
+  }
   const totalFailed = results.length - totalPassed;
-  const averageScore = results.reduce((sum, r) => sum + r.score, 0) / results.length;
+  const averageScore = scoreSum / results.length;
   const passRate = (totalPassed / results.length) * 100;
 
   return {
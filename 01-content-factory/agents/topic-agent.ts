@@ -1,6 +1,7 @@
 import { generateWithClaude } from "../integrations/anthropic";
 import type { ClientBrief, ContentTopic, ContentType, AgentResponse, EnrichedClientBrief } from "../types";
 import { formatTextualBriefForPrompt, buildSystemPromptSuffix } from "../services/brand-brief";
+import { parseJsonArray } from "../utils/json-extract";
 
 function buildTopicSystemPrompt(brief: EnrichedClientBrief): string {
   const baseSuffix = buildSystemPromptSuffix(brief);
@@ -88,12 +89,10 @@ Return ONLY a valid JSON array with this structure:
       temperature: 0.8,
     });
 
-    const jsonMatch = response.match(/\[[\s\S]*\]/);
-    if (!jsonMatch) {
+    const topics = parseJsonArray<ContentTopic>(response);
+    if (!topics) {
       throw new Error("Failed to parse topics JSON from response");
     }
-
-    const topics: ContentTopic[] = JSON.parse(jsonMatch[0]);
     
     return {
       success: true,
@@ -15,6 +15,8 @@ import {
   hasReferenceAsset,
   getReferenceAssetUrl
 } from "../services/brand-brief";
+import { parseJsonObject } from "../utils/json-extract";
+import { truncateText } from "../utils/text";
 
 const BASE_SYSTEM_PROMPT = `You are a video content strategist and scriptwriter. You create engaging video scripts optimized for:
 
@@ -64,9 +66,7 @@ async function generateSceneThumbnail(
   brief?: EnrichedClientBrief,
   totalScenes?: number
 ): Promise<string | undefined> {
-  const shortPrompt = visualDescription.length > 200 
-    ? visualDescription.substring(0, 200) + '...'
-    : visualDescription;
+  const shortPrompt = truncateText(visualDescription, 200);
   
   let enrichedPrompt: string;
   if (brief && hasReferenceAsset(brief)) {
@@ -265,13 +265,11 @@ Output as JSON:
     console.log(`[VideoAgent] Script generated using provider: ${textResult.provider}`);
     const response = textResult.content;
 
-    const jsonMatch = response.match(/\{[\s\S]*\}/);
-    if (!jsonMatch) {
+    const scriptData = parseJsonObject<VideoScript>(response);
+    if (!scriptData) {
       throw new Error("Failed to parse video script JSON");
     }
 
-    const scriptData: VideoScript = JSON.parse(jsonMatch[0]);
-
     console.log(`[VideoAgent] Generating thumbnails for ${scriptData.scenes?.length || 0} scenes...`);
     
     const sceneThumbnails: Record<number, string> = {};
@@ -225,6 +225,9 @@ async function waitForImageCompletion(
   const startTime = Date.now();
   const maxWaitMs = maxWaitSeconds * 1000;
   const pollIntervalMs = pollIntervalSeconds * 1000;
+  // Most images finish well inside the first interval, so poll early and back
+  // off (x1.5 per poll, with jitter) up to pollIntervalMs
+  let delayMs = Math.min(1000, pollIntervalMs);
 
   console.log(`[AlibabaImage] Waiting for task ${taskId} (max ${maxWaitSeconds}s)...`);
 
@@ -243,7 +246,10 @@ async function waitForImageCompletion(
       return result;
     }
 
-    await new Promise(resolve => setTimeout(resolve, pollIntervalMs));
+    const jitteredMs = delayMs * (0.8 + Math.random() * 0.4);
+    const remainingMs = maxWaitMs - (Date.now() - startTime);
+    await new Promise(resolve => setTimeout(resolve, Math.max(0, Math.min(jitteredMs, remainingMs))));
+    delayMs = Math.min(delayMs * 1.5, pollIntervalMs);
   }
 
   return {
@@ -1,10 +1,80 @@
 import Anthropic from "@anthropic-ai/sdk";
+import { createHash } from "crypto";
 
 const anthropic = new Anthropic({
   baseURL: process.env.AI_INTEGRATIONS_ANTHROPIC_BASE_URL,
   apiKey: process.env.AI_INTEGRATIONS_ANTHROPIC_API_KEY,
 });
 
+// Concurrency guard. A weekly run fans out topics x content types x QA reviews
+// at once; past the account's concurrent limit the API answers 429 and the SDK
+// retries, so extra parallelism only adds latency. Override via
+// `ANTHROPIC_MAX_CONCURRENT`; default 8.
+const CLAUDE_MAX_CONCURRENT = (() => {
+  const raw = process.env.ANTHROPIC_MAX_CONCURRENT;
+  const n = raw ? parseInt(raw, 10) : NaN;
+  return Number.isFinite(n) && n > 0 ? n : 8;
+})();
+
+let claudeActive = 0;
+const claudeQueue: Array<() => void> = [];
+
+async function acquireClaudeSlot(): Promise<() => void> {
+  if (claudeActive < CLAUDE_MAX_CONCURRENT) {
+    claudeActive++;
+  } else {
+    // The releasing caller hands its slot straight to us, so claudeActive
+    // already counts it and a newcomer can't slip in before we resume
+    await new Promise<void>((resolve) => claudeQueue.push(resolve));
+  }
+  return () => {
+    const next = claudeQueue.shift();
+    if (next) {
+      next();
+    } else {
+      claudeActive--;
+    }
+  };
+}
+
+// Low-temperature calls (QA reviews, scoring) are effectively deterministic,
+// so identical requests within the TTL reuse the earlier response.
+const RESPONSE_CACHE_MAX_TEMPERATURE = 0.3;
+const RESPONSE_CACHE_TTL_MS = 10 * 60 * 1000;
+const RESPONSE_CACHE_MAX_ENTRIES = 200;
+const responseCache = new Map<string, { text: string; expiresAt: number }>();
+
+function responseCacheKey(systemPrompt: string, userPrompt: string, maxTokens: number, temperature: number): string {
+  return createHash("sha256")
+    .update(JSON.stringify([systemPrompt, userPrompt, maxTokens, temperature]))
+    .digest("hex");
+}
+
+function getCachedResponse(key: string): string | undefined {
+  const entry = responseCache.get(key);
+  if (!entry) return undefined;
+  responseCache.delete(key);
+  if (entry.expiresAt <= Date.now()) return undefined;
+  responseCache.set(key, entry); // refresh LRU position
+  return entry.text;
+}
+
+function setCachedResponse(key: string, text: string): void {
+  if (responseCache.size >= RESPONSE_CACHE_MAX_ENTRIES) {
+    const oldest = responseCache.keys().next().value;
+    if (oldest !== undefined) responseCache.delete(oldest);
+  }
+  responseCache.set(key, { text, expiresAt: Date.now() + RESPONSE_CACHE_TTL_MS });
+}
+
+// Agent system prompts carry the same brand context across many calls, so mark
+// them as a cacheable prefix. Prompts below the model's minimum cacheable
+// length are processed normally.
+function cacheableSystemPrompt(systemPrompt: string): string | Anthropic.Messages.TextBlockParam[] {
+  if (!systemPrompt) return systemPrompt;
+  return [{ type: "text", text: systemPrompt, cache_control: { type: "ephemeral" } }];
+}
+
 export interface ChatMessage {
   role: "user" | "assistant";
   content: string;
@@ -18,17 +88,37 @@ export async function generateWithClaude(
     temperature?: number;
   } = {}
 ): Promise<string> {
-  const { maxTokens = 4096, temperature = 0.7 } = options;
+  const { maxTokens = 4096, temperature } = options;
+
+  const cacheKey = temperature !== undefined && temperature <= RESPONSE_CACHE_MAX_TEMPERATURE
+    ? responseCacheKey(systemPrompt, userPrompt, maxTokens, temperature)
+    : null;
+  if (cacheKey) {
+    const cached = getCachedResponse(cacheKey);
+    if (cached !== undefined) return cached;
+  }
 
-  const response = await anthropic.messages.create({
-    model: "claude-sonnet-4-5",
-    max_tokens: maxTokens,
-    system: systemPrompt,
-    messages: [{ role: "user", content: userPrompt }],
-  });
+  const release = await acquireClaudeSlot();
+  let response: Anthropic.Messages.Message;
+  try {
+    response = await anthropic.messages.create({
+      model: "claude-sonnet-4-5",
+      max_tokens: maxTokens,
+      // Only override the API default when the caller asks for a temperature
+      ...(temperature !== undefined && { temperature }),
+      system: cacheableSystemPrompt(systemPrompt),
+      messages: [{ role: "user", content: userPrompt }],
+    });
+  } finally {
+    release();
+  }
 
   const textBlock = response.content.find((block) => block.type === "text");
-  return textBlock?.text || "";
+  const text = textBlock?.text || "";
+  if (cacheKey && text) {
+    setCachedResponse(cacheKey, text);
+  }
+  return text;
 }
 
 export async function generateWithClaudeStreaming(
@@ -40,26 +130,32 @@ export async function generateWithClaudeStreaming(
     temperature?: number;
   } = {}
 ): Promise<string> {
-  const { maxTokens = 4096, temperature = 0.7 } = options;
+  const { maxTokens = 4096, temperature } = options;
 
   let fullResponse = "";
 
-  const stream = anthropic.messages.stream({
-    model: "claude-sonnet-4-5",
-    max_tokens: maxTokens,
-    system: systemPrompt,
-    messages: [{ role: "user", content: userPrompt }],
-  });
+  const release = await acquireClaudeSlot();
+  try {
+    const stream = anthropic.messages.stream({
+      model: "claude-sonnet-4-5",
+      max_tokens: maxTokens,
+      ...(temperature !== undefined && { temperature }),
+      system: cacheableSystemPrompt(systemPrompt),
+      messages: [{ role: "user", content: userPrompt }],
+    });
 
-  for await (const event of stream) {
-    if (
-      event.type === "content_block_delta" &&
-      event.delta.type === "text_delta"
-    ) {
-      const text = event.delta.text;
-      fullResponse += text;
-      onChunk(text);
+    for await (const event of stream) {
+      if (
+        event.type === "content_block_delta" &&
+        event.delta.type === "text_delta"
+      ) {
+        const text = event.delta.text;
+        fullResponse += text;
+        onChunk(text);
+      }
     }
+  } finally {
+    release();
   }
 
   return fullResponse;
@@ -90,7 +186,7 @@ export async function generateWithClaudeVision(
     temperature?: number;
   } = {}
 ): Promise<string> {
-  const { maxTokens = 4096, temperature = 0.3 } = options;
+  const { maxTokens = 4096, temperature } = options;
 
   const content: MessageContent[] = [];
 
@@ -111,12 +207,19 @@ export async function generateWithClaudeVision(
     text: userPrompt,
   });
 
-  const response = await anthropic.messages.create({
-    model: "claude-sonnet-4-5",
-    max_tokens: maxTokens,
-    system: systemPrompt,
-    messages: [{ role: "user", content }],
-  });
+  const release = await acquireClaudeSlot();
+  let response: Anthropic.Messages.Message;
+  try {
+    response = await anthropic.messages.create({
+      model: "claude-sonnet-4-5",
+      max_tokens: maxTokens,
+      ...(temperature !== undefined && { temperature }),
+      system: cacheableSystemPrompt(systemPrompt),
+      messages: [{ role: "user", content }],
+    });
+  } finally {
+    release();
+  }
 
   const textBlock = response.content.find((block) => block.type === "text");
   return textBlock?.text || "";
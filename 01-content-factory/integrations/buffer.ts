@@ -1,4 +1,5 @@
 import type { GeneratedContent } from "../types";
+import { mapWithConcurrency } from "../utils/concurrency";
 
 export interface BufferPost {
   text: string;
@@ -14,6 +15,7 @@ export interface BufferProfile {
 }
 
 const BUFFER_API_BASE = "https://api.bufferapp.com/1";
+const BUFFER_PUBLISH_CONCURRENCY = 3;
 
 async function bufferRequest(
   endpoint: string,
@@ -100,9 +102,10 @@ export async function publishToBuffer(
   options: {
     platforms?: string[];
     scheduledAt?: Date;
+    profiles?: BufferProfile[];
   } = {}
 ): Promise<{ success: boolean; results: any[] }> {
-  const profiles = await getBufferProfiles();
+  const profiles = options.profiles ?? await getBufferProfiles();
   
   if (profiles.length === 0) {
     return { success: false, results: [] };
@@ -129,21 +132,24 @@ export async function publishToBuffer(
 export async function autoPublishApprovedContent(
   contents: GeneratedContent[]
 ): Promise<{ published: number; failed: number }> {
-  let published = 0;
-  let failed = 0;
-
-  for (const content of contents) {
-    if (content.status !== "approved") continue;
-    
-    if (["linkedin", "twitter", "instagram"].includes(content.type)) {
-      const result = await publishToBuffer(content);
-      if (result.success) {
-        published++;
-      } else {
-        failed++;
-      }
-    }
+  const publishable = contents.filter(
+    (content) =>
+      content.status === "approved" &&
+      ["linkedin", "twitter", "instagram"].includes(content.type)
+  );
+
+  if (publishable.length === 0) {
+    return { published: 0, failed: 0 };
   }
 
-  return { published, failed };
+  // Profiles are the same for every post, so fetch them once for the batch
+  const profiles = await getBufferProfiles();
+  const results = await mapWithConcurrency(
+    publishable,
+    BUFFER_PUBLISH_CONCURRENCY,
+    (content) => publishToBuffer(content, { profiles })
+  );
+
+  const published = results.filter((result) => result.success).length;
+  return { published, failed: results.length - published };
 }
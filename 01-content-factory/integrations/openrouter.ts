@@ -1,4 +1,5 @@
 import OpenAI from "openai";
+import { parseJsonObject } from "../utils/json-extract";
 
 const OPENROUTER_API_KEY = process.env.OPENROUTER_API_KEY;
 const OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1";
@@ -360,8 +361,7 @@ Make it compelling and shareable.`;
     }
 
     try {
-      const jsonMatch = result.content?.match(/\{[\s\S]*\}/);
-      const analysis = jsonMatch ? JSON.parse(jsonMatch[0]) : null;
+      const analysis = result.content ? parseJsonObject(result.content) : null;
       
       return {
         success: true,
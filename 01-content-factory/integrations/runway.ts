@@ -1,6 +1,17 @@
 import { runwayTierManager, mapRunwayModelToCategory } from '../services/runway-tier-manager';
 
 const RUNWAY_BASE_URL = "https://api.dev.runwayml.com/v1";
+const RUNWAY_API_VERSION = "2024-11-06";
+
+// Headers shared by every Runway request; JSON bodies also need a Content-Type
+function runwayHeaders(apiKey: string, jsonBody: boolean = true): Record<string, string> {
+  const headers: Record<string, string> = {
+    'Authorization': `Bearer ${apiKey}`,
+    'X-Runway-Version': RUNWAY_API_VERSION,
+  };
+  if (jsonBody) headers['Content-Type'] = 'application/json';
+  return headers;
+}
 
 // Runway API task status types (from docs)
 export type RunwayTaskStatus = 
@@ -95,66 +106,74 @@ export const RUNWAY_PRICING = {
   eleven_multilingual_sts_v2: { type: 'audio', costPer2Sec: 1 },
 };
 
+// Placeholder stills for the no-provider path, keyed by prompt keywords
+const FALLBACK_IMAGE_CATEGORIES: { keywords: string[]; images: string[] }[] = [
+  {
+    keywords: ['office', 'business', 'corporate', 'meeting', 'team', 'professional', 'desk', 'leader', 'ceo', 'executive'],
+    images: [
+      'https://images.unsplash.com/photo-1497366216548-37526070297c?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1497215842964-222b430dc094?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1553028826-f4804a6dba3b?w=1920&h=1080&fit=crop',
+    ]
+  },
+  {
+    keywords: ['technology', 'tech', 'digital', 'software', 'data', 'ai', 'dashboard', 'screen', 'ui', 'interface', 'monitoring'],
+    images: [
+      'https://images.unsplash.com/photo-1518770660439-4636190af475?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1550751827-4bd374c3f58b?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=1920&h=1080&fit=crop',
+    ]
+  },
+  {
+    keywords: ['finance', 'money', 'bank', 'payment', 'fintech', 'investment', 'growth', 'chart', 'graph'],
+    images: [
+      'https://images.unsplash.com/photo-1611974789855-9c2a0a7236a3?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1590283603385-17ffb3a7f29f?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1559526324-4b87b5e36e44?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1920&h=1080&fit=crop',
+    ]
+  },
+  {
+    keywords: ['compliance', 'legal', 'regulation', 'security', 'shield', 'check', 'audit', 'document'],
+    images: [
+      'https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1507925921958-8a62f3d1a50d?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1589829545856-d10d557cf95f?w=1920&h=1080&fit=crop',
+    ]
+  },
+  {
+    keywords: ['success', 'celebration', 'win', 'achievement', 'launch', 'rocket', 'innovation'],
+    images: [
+      'https://images.unsplash.com/photo-1553729459-efe14ef6055d?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1519389950473-47ba0277781c?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1522071820081-009f0129c71c?w=1920&h=1080&fit=crop',
+    ]
+  },
+  {
+    keywords: ['call', 'action', 'cta', 'contact', 'website', 'link', 'download'],
+    images: [
+      'https://images.unsplash.com/photo-1557804506-669a67965ba0?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1531973576160-7125cd663d86?w=1920&h=1080&fit=crop',
+      'https://images.unsplash.com/photo-1542744173-8e7e53415bb0?w=1920&h=1080&fit=crop',
+    ]
+  }
+];
+
+const DEFAULT_FALLBACK_IMAGES = [
+  'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=1920&h=1080&fit=crop',
+  'https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=1920&h=1080&fit=crop',
+  'https://images.unsplash.com/photo-1620712943543-bcc4688e7485?w=1920&h=1080&fit=crop',
+  'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=1920&h=1080&fit=crop',
+];
+
 function getContextualFallbackImage(prompt: string): string {
   const promptLower = prompt.toLowerCase();
-  
-  const imageCategories: { keywords: string[]; images: string[] }[] = [
-    {
-      keywords: ['office', 'business', 'corporate', 'meeting', 'team', 'professional', 'desk', 'leader', 'ceo', 'executive'],
-      images: [
-        'https://images.unsplash.com/photo-1497366216548-37526070297c?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1497215842964-222b430dc094?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1560472354-b33ff0c44a43?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1553028826-f4804a6dba3b?w=1920&h=1080&fit=crop',
-      ]
-    },
-    {
-      keywords: ['technology', 'tech', 'digital', 'software', 'data', 'ai', 'dashboard', 'screen', 'ui', 'interface', 'monitoring'],
-      images: [
-        'https://images.unsplash.com/photo-1518770660439-4636190af475?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1550751827-4bd374c3f58b?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1504868584819-f8e8b4b6d7e3?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1551288049-bebda4e38f71?w=1920&h=1080&fit=crop',
-      ]
-    },
-    {
-      keywords: ['finance', 'money', 'bank', 'payment', 'fintech', 'investment', 'growth', 'chart', 'graph'],
-      images: [
-        'https://images.unsplash.com/photo-1611974789855-9c2a0a7236a3?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1590283603385-17ffb3a7f29f?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1559526324-4b87b5e36e44?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1460925895917-afdab827c52f?w=1920&h=1080&fit=crop',
-      ]
-    },
-    {
-      keywords: ['compliance', 'legal', 'regulation', 'security', 'shield', 'check', 'audit', 'document'],
-      images: [
-        'https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1507925921958-8a62f3d1a50d?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1554224155-6726b3ff858f?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1589829545856-d10d557cf95f?w=1920&h=1080&fit=crop',
-      ]
-    },
-    {
-      keywords: ['success', 'celebration', 'win', 'achievement', 'launch', 'rocket', 'innovation'],
-      images: [
-        'https://images.unsplash.com/photo-1553729459-efe14ef6055d?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1517245386807-bb43f82c33c4?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1519389950473-47ba0277781c?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1522071820081-009f0129c71c?w=1920&h=1080&fit=crop',
-      ]
-    },
-    {
-      keywords: ['call', 'action', 'cta', 'contact', 'website', 'link', 'download'],
-      images: [
-        'https://images.unsplash.com/photo-1557804506-669a67965ba0?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1531973576160-7125cd663d86?w=1920&h=1080&fit=crop',
-        'https://images.unsplash.com/photo-1542744173-8e7e53415bb0?w=1920&h=1080&fit=crop',
-      ]
-    }
-  ];
 
-  for (const category of imageCategories) {
+  for (const category of FALLBACK_IMAGE_CATEGORIES) {
     for (const keyword of category.keywords) {
       if (promptLower.includes(keyword)) {
         const randomIndex = Math.floor(Math.random() * category.images.length);
@@ -163,15 +182,8 @@ function getContextualFallbackImage(prompt: string): string {
     }
   }
 
-  const defaultImages = [
-    'https://images.unsplash.com/photo-1451187580459-43490279c0fa?w=1920&h=1080&fit=crop',
-    'https://images.unsplash.com/photo-1526374965328-7f61d4dc18c5?w=1920&h=1080&fit=crop',
-    'https://images.unsplash.com/photo-1620712943543-bcc4688e7485?w=1920&h=1080&fit=crop',
-    'https://images.unsplash.com/photo-1558494949-ef010cbdcc31?w=1920&h=1080&fit=crop',
-  ];
-  
-  const randomIndex = Math.floor(Math.random() * defaultImages.length);
-  return defaultImages[randomIndex];
+  const randomIndex = Math.floor(Math.random() * DEFAULT_FALLBACK_IMAGES.length);
+  return DEFAULT_FALLBACK_IMAGES[randomIndex];
 }
 
 async function generateImageWithGemini(prompt: string): Promise<{ success: boolean; imageUrl?: string; error?: string }> {
@@ -379,11 +391,7 @@ export async function generateVideoWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/image_to_video`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         promptImage: imageUrl,
         promptText: enhancedPrompt,
@@ -457,11 +465,7 @@ export async function generateVideoToVideoWithRunway(
 
     const response = await fetch(`${RUNWAY_BASE_URL}/video_to_video`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify(body),
     });
 
@@ -492,11 +496,7 @@ export async function upscaleVideoWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/video_upscale`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         promptVideo: videoUrl,
         model: 'upscale_v1',
@@ -534,11 +534,7 @@ export async function generateCharacterPerformance(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/character_performance`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         referenceMedia: referenceMediaUrl,
         driverVideo: driverVideoUrl,
@@ -593,11 +589,7 @@ export async function generateImageWithRunway(
 
     const response = await fetch(`${RUNWAY_BASE_URL}/text_to_image`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify(body),
     });
 
@@ -632,11 +624,7 @@ export async function generateSpeechWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/text_to_speech`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         text,
         model: 'eleven_multilingual_v2',
@@ -675,11 +663,7 @@ export async function generateSoundEffectWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/sound_effect`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         promptText: prompt,
         model: 'eleven_text_to_sound_v2',
@@ -714,11 +698,7 @@ export async function isolateVoiceWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/voice_isolation`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         audio: audioUrl,
         model: 'eleven_voice_isolation',
@@ -756,11 +736,7 @@ export async function dubVoiceWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/voice_dubbing`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         sourceAudio: sourceAudioUrl,
         targetLang: targetLanguage,
@@ -797,11 +773,7 @@ export async function transformSpeechWithRunway(
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/speech_to_speech`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'Content-Type': 'application/json',
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey),
       body: JSON.stringify({
         audio: audioUrl,
         voiceId: targetVoiceId,
@@ -832,10 +804,7 @@ export async function checkImageStatus(taskId: string): Promise<ImageGenerationR
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/tasks/${taskId}`, {
       method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey, false),
     });
 
     if (!response.ok) {
@@ -867,10 +836,7 @@ export async function checkAudioStatus(taskId: string): Promise<AudioGenerationR
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/tasks/${taskId}`, {
       method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey, false),
     });
 
     if (!response.ok) {
@@ -931,10 +897,7 @@ export async function checkVideoStatus(taskId: string): Promise<VideoGenerationR
   try {
     const response = await fetch(`${RUNWAY_BASE_URL}/tasks/${taskId}`, {
       method: 'GET',
-      headers: {
-        'Authorization': `Bearer ${apiKey}`,
-        'X-Runway-Version': '2024-11-06',
-      },
+      headers: runwayHeaders(apiKey, false),
     });
 
     if (!response.ok) {
@@ -23,6 +23,26 @@ import sharp from "sharp";
 // @ts-ignore - colorthief doesn't have type definitions
 import ColorThief from "colorthief";
 import { loadBrandAssetsFromDatabase } from "../services/brand-brief";
+import { truncateText } from "../utils/text";
+
+const MIME_TYPES_BY_EXT: Record<string, string> = {
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.gif': 'image/gif',
+  '.webp': 'image/webp',
+  '.svg': 'image/svg+xml',
+  '.mp4': 'video/mp4',
+  '.mov': 'video/quicktime',
+  '.webm': 'video/webm',
+};
+
+const IMAGE_ASSET_TYPES = new Set(['image/png', 'image/jpeg', 'image/gif', 'image/webp', 'image/svg+xml']);
+const VIDEO_ASSET_TYPES = new Set(['video/mp4', 'video/quicktime', 'video/webm']);
+
+function truncateTitle(title: string): string {
+  return truncateText(title, 50);
+}
 
 export interface PipelineState {
   runId: string;
@@ -66,8 +86,9 @@ export class ContentPipeline {
       onContentSave?: ContentSaveCallback;
     } = {}
   ) {
+    const startedAt = new Date();
     this.state = {
-      runId: options.runId || `run_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`,
+      runId: options.runId || `run_${startedAt.getTime()}_${Math.random().toString(36).slice(2, 11)}`,
       config,
       topics: [],
       contents: [],
@@ -80,7 +101,7 @@ export class ContentPipeline {
       },
       errors: [],
       status: "pending",
-      startedAt: new Date(),
+      startedAt,
     };
     this.onProgress = options.onProgress;
     this.onContentCreated = options.onContentCreated;
@@ -94,7 +115,9 @@ export class ContentPipeline {
   }
 
   private updateState(updates: Partial<PipelineState>) {
-    this.state = { ...this.state, ...updates };
+    // Mutate in place; stats, qaResults and contents are already updated in
+    // place elsewhere, so copying the whole state object bought nothing
+    Object.assign(this.state, updates);
     this.onProgress?.(this.state);
   }
 
@@ -155,7 +178,7 @@ export class ContentPipeline {
 
       this.updateState({ topics: topicsResult.data });
       console.log(`[Pipeline] Step 1 complete: Generated ${topicsResult.data.length} topics`);
-      topicsResult.data.forEach((t, i) => console.log(`  - Topic ${i+1}: ${t.title}`));
+      console.log(topicsResult.data.map((t, i) => `  - Topic ${i+1}: ${t.title}`).join('\n'));
 
       await this.emitActivityLog(
         "topic_generated",
@@ -164,29 +187,35 @@ export class ContentPipeline {
         { topicCount: topicsResult.data.length, topics: topicsResult.data.map(t => t.title) }
       );
 
-      // Step 2: Run parallel content generation pipelines for each topic
+      // Step 2: Run parallel content generation pipelines for each topic.
+      // Step 3: QA each topic's pieces as soon as that topic finishes, rather
+      // than waiting for the slowest topic before any review starts.
       console.log(`[Pipeline] Step 2: Generating content for ${this.state.topics.length} topics...`);
       const contentPromises: Promise<GeneratedContent[]>[] = [];
+      const generatedContents: GeneratedContent[] = [];
+      let topicsGenerating = this.state.topics.length;
 
       for (const topic of this.state.topics) {
-        contentPromises.push(this.generateContentForTopic(topic));
+        contentPromises.push(
+          this.generateContentForTopic(topic).then(async (contents) => {
+            // Report generated pieces before QA so progress reflects them right away
+            generatedContents.push(...contents);
+            this.state.stats.totalGenerated = generatedContents.length;
+            this.updateState({ contents: generatedContents });
+            if (--topicsGenerating === 0) {
+              console.log(`[Pipeline] Step 2 complete: Generated ${generatedContents.length} content pieces`);
+            }
+
+            console.log(`[Pipeline] Step 3: Running QA on ${contents.length} pieces for "${topic.title}"...`);
+            await this.runQAGate(contents);
+            return contents;
+          })
+        );
       }
 
+      // Every topic has settled; keep the final list in topic order
       const allContents = await Promise.all(contentPromises);
-      const flatContents = allContents.flat();
-      console.log(`[Pipeline] Step 2 complete: Generated ${flatContents.length} content pieces`);
-
-      this.updateState({
-        contents: flatContents,
-        stats: {
-          ...this.state.stats,
-          totalGenerated: flatContents.length,
-        },
-      });
-
-      // Step 3: Run QA on all content
-      console.log(`[Pipeline] Step 3: Running QA on ${flatContents.length} pieces...`);
-      await this.runQAGate();
+      this.updateState({ contents: allContents.flat() });
       console.log(`[Pipeline] Step 3 complete: QA finished. Passed: ${this.state.stats.totalPassed}, Failed: ${this.state.stats.totalFailed}`);
 
       // Step 4: Finalize
@@ -214,9 +243,9 @@ export class ContentPipeline {
     } catch (error: any) {
       console.error(`[Pipeline] FATAL ERROR: ${error.message}`);
       console.error(error.stack);
+      this.state.errors.push(error.message);
       this.updateState({
         status: "failed",
-        errors: [...this.state.errors, error.message],
         completedAt: new Date(),
       });
 
@@ -236,17 +265,19 @@ export class ContentPipeline {
     const { contentTypes, clientBrief } = this.state.config;
     console.log(`[Pipeline] Generating content for topic: "${topic.title}"`);
 
-    const truncateTitle = (title: string, maxLen = 50) => 
-      title.length > maxLen ? title.substring(0, maxLen) + '...' : title;
+    // Content types enabled for both the run and this topic, resolved once
+    const topicTypes = new Set(topic.contentTypes);
+    const enabledTypes = new Set(contentTypes.filter((type) => topicTypes.has(type)));
 
     // Run content generation in parallel based on content types
+    // (content_started logs are written alongside each model call, not ahead of it)
     const promises: Promise<void>[] = [];
 
     // Blog
-    if (contentTypes.includes("blog") && topic.contentTypes.includes("blog")) {
+    if (enabledTypes.has("blog")) {
       promises.push(
         (async () => {
-          await this.emitActivityLog(
+          const started = this.emitActivityLog(
             "content_started",
             "info",
             `Generating blog post: ${topic.title}`,
@@ -254,7 +285,7 @@ export class ContentPipeline {
           );
           try {
             console.log(`[Pipeline]   -> Generating blog for: ${topic.title}`);
-            const result = await generateBlogPost(topic, clientBrief);
+            const [result] = await Promise.all([generateBlogPost(topic, clientBrief), started]);
             if (result.success && result.data) {
               contents.push(result.data);
               await this.incrementCounter(1);
@@ -277,6 +308,7 @@ export class ContentPipeline {
             }
           } catch (err: any) {
             console.error(`[Pipeline]   <- Blog generation error: ${err.message}`);
+            await started;
             await this.emitActivityLog(
               "content_failed",
               "error",
@@ -289,16 +321,14 @@ export class ContentPipeline {
     }
 
     // Social Posts (LinkedIn, Twitter, Instagram)
-    const socialPlatforms = ["linkedin", "twitter", "instagram"].filter(
-      (p) =>
-        contentTypes.includes(p as ContentType) &&
-        topic.contentTypes.includes(p as ContentType)
-    ) as ("linkedin" | "twitter" | "instagram")[];
+    const socialPlatforms = (["linkedin", "twitter", "instagram"] as const).filter(
+      (p) => enabledTypes.has(p)
+    );
 
     if (socialPlatforms.length > 0) {
       promises.push(
         (async () => {
-          await this.emitActivityLog(
+          const started = this.emitActivityLog(
             "content_started",
             "info",
             `Generating social posts (${socialPlatforms.join(', ')}) for: ${truncateTitle(topic.title)}`,
@@ -306,19 +336,19 @@ export class ContentPipeline {
           );
           try {
             console.log(`[Pipeline]   -> Generating social posts (${socialPlatforms.join(', ')}) for: ${topic.title}`);
-            const result = await generateAllSocialPosts(topic, clientBrief, socialPlatforms);
+            const [result] = await Promise.all([generateAllSocialPosts(topic, clientBrief, socialPlatforms), started]);
             if (result.success && result.data) {
               contents.push(...result.data);
               await this.incrementCounter(result.data.length);
-              for (const content of result.data) {
+              await Promise.all(result.data.map((content) => {
                 this.updateStats(content.type);
-                await this.emitActivityLog(
+                return this.emitActivityLog(
                   "content_completed",
                   "success",
                   `Completed ${content.type} post for topic: ${truncateTitle(topic.title)}`,
                   { contentType: content.type, contentId: content.id, title: content.title }
                 );
-              }
+              }));
               console.log(`[Pipeline]   <- Social posts generated: ${result.data.length} pieces`);
             } else {
               console.error(`[Pipeline]   <- Social posts generation failed: ${result.error}`);
@@ -331,6 +361,7 @@ export class ContentPipeline {
             }
           } catch (err: any) {
             console.error(`[Pipeline]   <- Social posts generation error: ${err.message}`);
+            await started;
             await this.emitActivityLog(
               "content_failed",
               "error",
@@ -342,34 +373,35 @@ export class ContentPipeline {
       );
     }
 
-    // Ad Copy (Facebook, Google)
-    if (
-      (contentTypes.includes("facebook_ad") || contentTypes.includes("google_ad")) &&
-      (topic.contentTypes.includes("facebook_ad") || topic.contentTypes.includes("google_ad"))
-    ) {
+    // Ad Copy (Facebook, Google) - only the platforms enabled for this topic
+    const adPlatforms = (["facebook_ad", "google_ad"] as const).filter(
+      (p) => enabledTypes.has(p)
+    );
+
+    if (adPlatforms.length > 0) {
       promises.push(
         (async () => {
-          await this.emitActivityLog(
+          const started = this.emitActivityLog(
             "content_started",
             "info",
             `Generating ad copy for: ${truncateTitle(topic.title)}`,
-            { contentType: "ad_copy", topicTitle: topic.title }
+            { contentType: "ad_copy", platforms: adPlatforms, topicTitle: topic.title }
           );
           try {
             console.log(`[Pipeline]   -> Generating ad copy for: ${topic.title}`);
-            const result = await generateAllAdCopy(topic, clientBrief);
+            const [result] = await Promise.all([generateAllAdCopy(topic, clientBrief, adPlatforms), started]);
             if (result.success && result.data) {
               contents.push(...result.data);
               await this.incrementCounter(result.data.length);
-              for (const content of result.data) {
+              await Promise.all(result.data.map((content) => {
                 this.updateStats(content.type);
-                await this.emitActivityLog(
+                return this.emitActivityLog(
                   "content_completed",
                   "success",
                   `Completed ${content.type} for topic: ${truncateTitle(topic.title)}`,
                   { contentType: content.type, contentId: content.id, title: content.title }
                 );
-              }
+              }));
               console.log(`[Pipeline]   <- Ad copy generated: ${result.data.length} pieces`);
             } else {
               console.error(`[Pipeline]   <- Ad copy generation failed: ${result.error}`);
@@ -382,6 +414,7 @@ export class ContentPipeline {
             }
           } catch (err: any) {
             console.error(`[Pipeline]   <- Ad copy generation error: ${err.message}`);
+            await started;
             await this.emitActivityLog(
               "content_failed",
               "error",
@@ -394,13 +427,10 @@ export class ContentPipeline {
     }
 
     // Video Script
-    if (
-      contentTypes.includes("video_script") &&
-      topic.contentTypes.includes("video_script")
-    ) {
+    if (enabledTypes.has("video_script")) {
       promises.push(
         (async () => {
-          await this.emitActivityLog(
+          const started = this.emitActivityLog(
             "content_started",
             "info",
             `Generating video script: ${truncateTitle(topic.title)}`,
@@ -408,7 +438,7 @@ export class ContentPipeline {
           );
           try {
             console.log(`[Pipeline]   -> Generating video script for: ${topic.title}`);
-            const result = await generateVideoScript(topic, clientBrief);
+            const [result] = await Promise.all([generateVideoScript(topic, clientBrief), started]);
             if (result.success && result.data) {
               contents.push(result.data);
               await this.incrementCounter(1);
@@ -431,6 +461,7 @@ export class ContentPipeline {
             }
           } catch (err: any) {
             console.error(`[Pipeline]   <- Video script generation error: ${err.message}`);
+            await started;
             await this.emitActivityLog(
               "content_failed",
               "error",
@@ -452,8 +483,10 @@ export class ContentPipeline {
     this.state.stats.byType[type] = currentCount + 1;
   }
 
-  private async runQAGate(): Promise<void> {
-    const qaPromises = this.state.contents.map(async (content) => {
+  private async runQAGate(contents: GeneratedContent[]): Promise<void> {
+    if (contents.length === 0) return;
+
+    const qaPromises = contents.map(async (content) => {
       let qaScore: number | undefined;
       
       try {
@@ -573,21 +606,26 @@ export class ContentPipeline {
     const assets = brandVoice.referenceAssets;
     const validAssets: Record<string, string> = {};
 
-    for (const [key, ref] of Object.entries(assets)) {
+    // Each check is independent (HEAD request or local stat), so run them together
+    const entries = Object.entries(assets);
+    const results = await Promise.all(entries.map(async ([key, ref]) => {
       try {
         if (ref.startsWith('http://') || ref.startsWith('https://')) {
           await this.validateUrl(key, ref);
-          validAssets[key] = ref;
-        } else {
-          const isValid = await this.validateLocalFile(key, ref);
-          if (isValid) {
-            validAssets[key] = ref;
-          }
+          return true;
         }
+        return await this.validateLocalFile(key, ref);
       } catch (error: any) {
         this.validationErrors.push(`Asset ${key}: ${error.message}`);
+        return false;
       }
-    }
+    }));
+
+    entries.forEach(([key, ref], i) => {
+      if (results[i]) {
+        validAssets[key] = ref;
+      }
+    });
 
     // Update referenceAssets to only include valid ones
     if (brandVoice) {
@@ -640,12 +678,14 @@ export class ContentPipeline {
   }
 
   private async validateLocalFile(key: string, filePath: string): Promise<boolean> {
-    if (!fs.existsSync(filePath)) {
+    let stats: fs.Stats;
+    try {
+      stats = await fs.promises.stat(filePath);
+    } catch {
       this.validationErrors.push(`Asset ${key}: File not found: ${filePath}`);
       return false;
     }
 
-    const stats = fs.statSync(filePath);
     if (stats.size > 50 * 1024 * 1024) {
       this.validationErrors.push(`Asset ${key}: File too large (${(stats.size / 1024 / 1024).toFixed(2)}MB)`);
       return false;
@@ -678,26 +718,15 @@ export class ContentPipeline {
 
   private isValidAssetType(key: string, mimeType: string): boolean {
     if (key.includes('logo') || key.includes('mood_board')) {
-      return ['image/png', 'image/jpeg', 'image/gif', 'image/webp', 'image/svg+xml'].includes(mimeType);
+      return IMAGE_ASSET_TYPES.has(mimeType);
     } else if (key.includes('ref_video') || key.includes('video')) {
-      return ['video/mp4', 'video/quicktime', 'video/webm'].includes(mimeType);
+      return VIDEO_ASSET_TYPES.has(mimeType);
     }
     return true; // Default allow
   }
 
   private getMimeTypeFromExt(ext: string): string {
-    const map: Record<string, string> = {
-      '.png': 'image/png',
-      '.jpg': 'image/jpeg',
-      '.jpeg': 'image/jpeg',
-      '.gif': 'image/gif',
-      '.webp': 'image/webp',
-      '.svg': 'image/svg+xml',
-      '.mp4': 'video/mp4',
-      '.mov': 'video/quicktime',
-      '.webm': 'video/webm',
-    };
-    return map[ext] || 'application/octet-stream';
+    return MIME_TYPES_BY_EXT[ext] || 'application/octet-stream';
   }
 
   /**
@@ -14,6 +14,9 @@ import {
 import { eq, and, desc, sql, gt, gte, lte } from "drizzle-orm";
 import { healthMonitor, PROVIDER_CONFIG, type ProviderName } from "./provider-health-monitor";
 
+// Compiled wildcard provider patterns, shared across monitoring cycles
+const providerPatternCache = new Map<string, RegExp>();
+
 interface TriggerConditions {
   threshold?: number;
   windowMinutes?: number;
@@ -195,6 +198,15 @@ class AutoRemediationEngine {
     const providers = await db.select().from(providerMetrics);
 
     for (const rule of rules) {
+      // Parsed once per rule rather than once per (rule, provider) pair
+      let conditions: TriggerConditions;
+      try {
+        conditions = JSON.parse(rule.triggerConditions || "{}");
+      } catch (error) {
+        console.error(`[AutoRemediation] Invalid trigger conditions for rule ${rule.ruleId}:`, error);
+        continue;
+      }
+
       for (const provider of providers) {
         if (rule.providerPattern && !this.matchesPattern(provider.providerName, rule.providerPattern)) {
           continue;
@@ -204,7 +216,7 @@ class AutoRemediationEngine {
         }
 
         try {
-          const evaluation = await this.evaluateTrigger(rule, provider);
+          const evaluation = await this.evaluateTrigger(rule, provider, conditions);
           
           if (evaluation.shouldTrigger) {
             const canExecute = await this.checkExecutionLimits(rule);
@@ -230,7 +242,11 @@ class AutoRemediationEngine {
   private matchesPattern(providerName: string, pattern: string): boolean {
     if (pattern === "*") return true;
     if (pattern.includes("*")) {
-      const regex = new RegExp("^" + pattern.replace(/\*/g, ".*") + "$");
+      let regex = providerPatternCache.get(pattern);
+      if (!regex) {
+        regex = new RegExp("^" + pattern.replace(/\*/g, ".*") + "$");
+        providerPatternCache.set(pattern, regex);
+      }
       return regex.test(providerName);
     }
     return providerName === pattern;
@@ -238,10 +254,9 @@ class AutoRemediationEngine {
 
   private async evaluateTrigger(
     rule: RemediationRule,
-    provider: { providerName: string; serviceType: string; [key: string]: unknown }
+    provider: { providerName: string; serviceType: string; [key: string]: unknown },
+    conditions: TriggerConditions
   ): Promise<TriggerEvaluation> {
-    const conditions: TriggerConditions = JSON.parse(rule.triggerConditions || "{}");
-
     switch (rule.triggerType) {
       case "error_rate_threshold":
         return this.evaluateErrorRate(provider, conditions);
@@ -310,11 +325,15 @@ class AutoRemediationEngine {
     `);
 
     const statuses = (recentRequests.rows as Array<{ status: string }>).map(r => r.status);
-    const allFailed = statuses.length >= consecutiveCount && statuses.every(s => s === "failed");
+    let failedCount = 0;
+    for (const status of statuses) {
+      if (status === "failed") failedCount++;
+    }
+    const allFailed = statuses.length >= consecutiveCount && failedCount === statuses.length;
 
     return {
       shouldTrigger: allFailed,
-      currentValue: statuses.filter(s => s === "failed").length,
+      currentValue: failedCount,
       threshold: consecutiveCount,
       details: { recentStatuses: statuses },
     };
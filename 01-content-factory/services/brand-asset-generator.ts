@@ -4,6 +4,7 @@ import { generateImageWithGemini } from '../integrations/gemini-image';
 import { generateImageWithFal, isFalConfigured } from '../integrations/fal-ai';
 import { generateWithClaude } from '../integrations/anthropic';
 import { healthMonitor } from './provider-health-monitor';
+import { mapWithConcurrency } from '../utils/concurrency';
 import type { 
   BrandProfile, 
   AssetType, 
@@ -23,6 +24,9 @@ const uuidv4 = () => randomUUID();
 // ============================================
 
 const ASSET_OUTPUT_DIR = 'uploads/brand-assets';
+// Icons are independent Gemini calls; generate a few at a time. Each worker
+// still pauses between requests since generateImageWithGemini has no 429 retry.
+const ICON_GENERATION_CONCURRENCY = 3;
 
 // Storage interface for database persistence
 let storageInstance: any = null;
@@ -366,7 +370,7 @@ export async function generateIconSet(
   
   console.log(`[BrandAssetGenerator] Generating ${iconNames.length} icons for client ${clientId} (logo ref: ${logoReference ? 'yes' : 'no'})`);
   
-  for (const iconName of iconNames) {
+  const iconAssets = await mapWithConcurrency(iconNames, ICON_GENERATION_CONCURRENCY, async (iconName) => {
     const promptContext = generatePrompt({
       brandProfile,
       assetType: 'icon_individual',
@@ -392,21 +396,26 @@ export async function generateIconSet(
           'image/png', { width: 48, height: 48 }, { iconName, provider: 'gemini' }
         );
         
-        assets.push({
+        return {
           id: uuidv4(),
           localPath,
           base64: geminiResult.imageDataUrl,
           mimeType: 'image/png',
           dimensions: { width: 48, height: 48 },
           metadata: { iconName },
-        });
+        };
       }
     } catch (error: any) {
       console.error(`[BrandAssetGenerator] Icon ${iconName} generation failed:`, error.message);
+    } finally {
+      // Small delay between each worker's requests to avoid rate limiting
+      await new Promise(resolve => setTimeout(resolve, 500));
     }
-    
-    // Small delay between requests to avoid rate limiting
-    await new Promise(resolve => setTimeout(resolve, 500));
+    return null;
+  });
+  
+  for (const asset of iconAssets) {
+    if (asset) assets.push(asset);
   }
   
   return {
@@ -342,7 +342,21 @@ export function composeBrandBrief(
   };
 }
 
+// Every agent in a run formats the same composed brief, so memoize the
+// brief-only prompt fragments per brief object
+const textualBriefCache = new WeakMap<EnrichedClientBrief, string>();
+const systemPromptSuffixCache = new WeakMap<EnrichedClientBrief, string>();
+
 export function formatTextualBriefForPrompt(brief: EnrichedClientBrief): string {
+  let formatted = textualBriefCache.get(brief);
+  if (formatted === undefined) {
+    formatted = renderTextualBrief(brief);
+    textualBriefCache.set(brief, formatted);
+  }
+  return formatted;
+}
+
+function renderTextualBrief(brief: EnrichedClientBrief): string {
   const t = brief.textual;
   
   return `
@@ -422,6 +436,15 @@ ${formatVisualBriefForPrompt(brief)}`;
 }
 
 export function buildSystemPromptSuffix(brief: EnrichedClientBrief): string {
+  let suffix = systemPromptSuffixCache.get(brief);
+  if (suffix === undefined) {
+    suffix = renderSystemPromptSuffix(brief);
+    systemPromptSuffixCache.set(brief, suffix);
+  }
+  return suffix;
+}
+
+function renderSystemPromptSuffix(brief: EnrichedClientBrief): string {
   const t = brief.textual;
   
   return `You are writing for ${t.brandName}. Embody the ${t.archetype} archetype with traits: ${t.personalityTraits.join(', ')}. Use a ${t.toneDescription} tone (formality: ${t.toneFormality}/10, energy: ${t.toneEnergy}/10). Target audience: ${t.audienceDemographics}. Naturally incorporate keywords: ${t.keywords.slice(0, 5).join(', ')}.${t.forbiddenWords.length ? ` NEVER use these words: ${t.forbiddenWords.join(', ')}.` : ''}`;
@@ -15,6 +15,11 @@ import type { QualityTier } from "../../shared/schema";
 // Provider quarantine tracking - in-memory for speed
 const providerQuarantine: Map<string, { until: Date; reason: string; failureCount: number }> = new Map();
 
+// Per-provider tail of pending metric updates. updateProviderMetrics is a
+// read-modify-write, so updates for the same provider are chained while
+// different providers still proceed concurrently.
+const providerMetricsLocks: Map<string, Promise<void>> = new Map();
+
 // Hard failure patterns that trigger long quarantine
 const HARD_FAILURE_PATTERNS = [
   { pattern: /access denied/i, quarantineMinutes: 60, reason: 'access_denied' },
@@ -582,7 +587,25 @@ class ProviderHealthMonitor {
     return false;
   }
 
-  private async updateProviderMetrics(
+  private updateProviderMetrics(
+    providerName: string, 
+    result: RequestResult
+  ): Promise<void> {
+    const previous = providerMetricsLocks.get(providerName) || Promise.resolve();
+    const next = previous
+      .catch(() => undefined)
+      .then(() => this.applyProviderMetrics(providerName, result));
+    const tail = next.catch(() => undefined);
+    providerMetricsLocks.set(providerName, tail);
+    tail.then(() => {
+      if (providerMetricsLocks.get(providerName) === tail) {
+        providerMetricsLocks.delete(providerName);
+      }
+    });
+    return next;
+  }
+
+  private async applyProviderMetrics(
     providerName: string, 
     result: RequestResult
   ): Promise<void> {
@@ -601,10 +624,12 @@ class ProviderHealthMonitor {
     const newFailureCount = current.failureCount + (result.success ? 0 : 1);
     const newTotalRequests = current.totalRequests + 1;
     
+    // Incremental (Welford) mean: avoids re-expanding the running total, which
+    // loses precision once totalRequests grows large
     const currentAvgLatency = parseFloat(current.avgLatencyMs || '0');
     const newAvgLatency = currentAvgLatency === 0 
       ? result.latencyMs 
-      : (currentAvgLatency * (newTotalRequests - 1) + result.latencyMs) / newTotalRequests;
+      : currentAvgLatency + (result.latencyMs - currentAvgLatency) / newTotalRequests;
 
     const successRate = newTotalRequests > 0 ? (newSuccessCount / newTotalRequests) * 100 : 100;
     const latencyPenalty = Math.min(newAvgLatency / 10000, 20); // Up to 20 point penalty for slow responses
@@ -814,31 +839,24 @@ class ProviderHealthMonitor {
 
     let providers = await query;
 
-    // Filter out rate-limited providers
+    // Single pass over the candidates: rate limits, quarantine (CRITICAL for
+    // self-healing), free-only and explicit exclusions, in that order
+    const freeOnly = options?.freeOnly === true;
+    const excluded = options?.excludeProviders ? new Set(options.excludeProviders) : null;
     providers = providers.filter(p => {
       if (p.rateLimitResetAt && new Date(p.rateLimitResetAt) > now) {
         return false;
       }
-      return true;
-    });
-
-    // Filter out quarantined providers (CRITICAL for self-healing)
-    providers = providers.filter(p => {
       if (this.isProviderQuarantined(p.providerName)) {
         console.log(`[HealthMonitor] Skipping quarantined provider: ${p.providerName}`);
         return false;
       }
-      return true;
+      if (freeOnly && !p.isFreeProvider) {
+        return false;
+      }
+      return !excluded || !excluded.has(p.providerName);
     });
 
-    if (options?.freeOnly) {
-      providers = providers.filter(p => p.isFreeProvider);
-    }
-
-    if (options?.excludeProviders) {
-      providers = providers.filter(p => !options.excludeProviders!.includes(p.providerName));
-    }
-
     if (options?.requestParams) {
       providers = await this.filterByErrorPatterns(providers, options.requestParams);
     }
@@ -914,7 +932,22 @@ class ProviderHealthMonitor {
       .from(providerMetrics)
       .orderBy(desc(providerMetrics.priority));
 
-    return metrics.map(m => ({
+    return metrics.map(m => this.toProviderHealthStatus(m, now));
+  }
+
+  async getProviderStatusByType(serviceType: string): Promise<ProviderHealthStatus[]> {
+    // Filter in the query so only matching rows are fetched and mapped
+    const now = new Date();
+    const metrics = await db.select()
+      .from(providerMetrics)
+      .where(eq(providerMetrics.serviceType, serviceType))
+      .orderBy(desc(providerMetrics.priority));
+
+    return metrics.map(m => this.toProviderHealthStatus(m, now));
+  }
+
+  private toProviderHealthStatus(m: typeof providerMetrics.$inferSelect, now: Date): ProviderHealthStatus {
+    return {
       providerName: m.providerName,
       serviceType: m.serviceType,
       isHealthy: m.isHealthy && (!m.rateLimitResetAt || new Date(m.rateLimitResetAt) <= now),
@@ -925,12 +958,7 @@ class ProviderHealthMonitor {
       lastError: m.lastErrorMessage || undefined,
       priority: m.priority,
       isFreeProvider: m.isFreeProvider,
-    }));
-  }
-
-  async getProviderStatusByType(serviceType: string): Promise<ProviderHealthStatus[]> {
-    const all = await this.getAllProviderStatus();
-    return all.filter(p => p.serviceType === serviceType);
+    };
   }
 
   async getRecentHealingActions(limit = 20): Promise<Array<{
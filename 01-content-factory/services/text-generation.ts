@@ -7,12 +7,57 @@ import { healthMonitor } from './provider-health-monitor';
 // name is Replit-managed and is often a placeholder when the integration
 // isn't connected (the Anthropic one was literally "_DUMMY_API_KEY_"), so
 // the user-supplied GEMINI_API_KEY / GOOGLE_API_KEY are tried first.
+// Secrets are fixed for the life of the process, so the list is built once.
+let cachedGeminiKeys: string[] | null = null;
+
 function geminiKeyCandidates(): string[] {
-  return [
-    process.env.GEMINI_API_KEY,
-    process.env.GOOGLE_API_KEY,
-    process.env.AI_INTEGRATIONS_GEMINI_API_KEY,
-  ].filter((k): k is string => !!k && k.length > 10 && !/dummy|placeholder/i.test(k));
+  if (cachedGeminiKeys === null) {
+    cachedGeminiKeys = [
+      process.env.GEMINI_API_KEY,
+      process.env.GOOGLE_API_KEY,
+      process.env.AI_INTEGRATIONS_GEMINI_API_KEY,
+    ].filter((k): k is string => !!k && k.length > 10 && !/dummy|placeholder/i.test(k));
+  }
+  return cachedGeminiKeys;
+}
+
+// One client per key, reused across calls instead of rebuilt per request
+const geminiClients = new Map<string, GoogleGenAI>();
+
+function getGeminiClient(apiKey: string): GoogleGenAI {
+  let client = geminiClients.get(apiKey);
+  if (!client) {
+    client = new GoogleGenAI({ apiKey });
+    geminiClients.set(apiKey, client);
+  }
+  return client;
+}
+
+// Concurrency guard for Gemini text calls, same hand-off semaphore as
+// acquireClaudeSlot. Override via `GEMINI_MAX_CONCURRENT`; default 8.
+const GEMINI_MAX_CONCURRENT = (() => {
+  const raw = process.env.GEMINI_MAX_CONCURRENT;
+  const n = raw ? parseInt(raw, 10) : NaN;
+  return Number.isFinite(n) && n > 0 ? n : 8;
+})();
+
+let geminiActive = 0;
+const geminiQueue: Array<() => void> = [];
+
+async function acquireGeminiSlot(): Promise<() => void> {
+  if (geminiActive < GEMINI_MAX_CONCURRENT) {
+    geminiActive++;
+  } else {
+    await new Promise<void>((resolve) => geminiQueue.push(resolve));
+  }
+  return () => {
+    const next = geminiQueue.shift();
+    if (next) {
+      next();
+    } else {
+      geminiActive--;
+    }
+  };
 }
 
 function geminiConfigured(): boolean {
@@ -33,24 +78,29 @@ async function generateWithGemini(
 ): Promise<TextGenerationResult> {
   const keys = geminiKeyCandidates();
   let lastErr: unknown;
-  for (const apiKey of keys) {
-    try {
-      const ai = new GoogleGenAI({ apiKey });
-      const resp = await ai.models.generateContent({
-        model: 'gemini-2.5-flash',
-        contents: prompt,
-        config: {
-          ...(options.systemPrompt ? { systemInstruction: options.systemPrompt } : {}),
-          maxOutputTokens: options.maxTokens || 4000,
-          temperature: options.temperature ?? 0.7,
-        },
-      });
-      const content = resp.text;
-      if (content) return { success: true, content, provider: 'gemini' };
-    } catch (err) {
-      lastErr = err;
-      // try the next candidate key
+  const release = await acquireGeminiSlot();
+  try {
+    for (const apiKey of keys) {
+      try {
+        const ai = getGeminiClient(apiKey);
+        const resp = await ai.models.generateContent({
+          model: 'gemini-2.5-flash',
+          contents: prompt,
+          config: {
+            ...(options.systemPrompt ? { systemInstruction: options.systemPrompt } : {}),
+            maxOutputTokens: options.maxTokens || 4000,
+            temperature: options.temperature ?? 0.7,
+          },
+        });
+        const content = resp.text;
+        if (content) return { success: true, content, provider: 'gemini' };
+      } catch (err) {
+        lastErr = err;
+        // try the next candidate key
+      }
     }
+  } finally {
+    release();
   }
   throw lastErr ?? new Error('Gemini: no working API key');
 }
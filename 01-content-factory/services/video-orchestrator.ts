@@ -2,6 +2,7 @@ import { randomBytes } from 'crypto';
 import { generateTextWithFallback } from './text-generation';
 import type { BrandProfileJSON } from '../../shared/schema';
 import { composeBrandBrief, getBrandMandatoryCTA, getMandatoryCTAFromBasicBrief, buildBrandClosingContext, type EnrichedClientBrief } from './brand-brief';
+import { parseJsonObject } from '../utils/json-extract';
 
 function generateId(): string {
   return randomBytes(8).toString('hex');
@@ -215,12 +216,11 @@ Create a complete video script. IMPORTANT: All visual descriptions MUST incorpor
   }
 
   try {
-    const jsonMatch = result.content.match(/\{[\s\S]*\}/);
-    if (!jsonMatch) {
+    const script = parseJsonObject(result.content);
+    if (!script) {
       return { success: false, error: 'Failed to parse video script JSON from response' };
     }
     
-    const script = JSON.parse(jsonMatch[0]);
     console.log(`[VideoOrchestrator] Script generated with ${script.scenes?.length || 0} scenes using ${result.provider}`);
     
     return { success: true, script, provider: result.provider };
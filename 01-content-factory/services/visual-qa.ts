@@ -2,6 +2,7 @@ import { generateWithClaude, generateWithClaudeVision } from "../integrations/an
 import type { BrandProfileJSON } from "../../shared/schema";
 import type { EnrichedClientBrief } from "./brand-brief";
 import type { AgentResponse } from "../types";
+import { parseJsonObject } from "../utils/json-extract";
 
 async function fetchImageAsBase64(url: string): Promise<{ base64: string; mimeType: "image/jpeg" | "image/png" | "image/gif" | "image/webp" } | null> {
   try {
@@ -362,12 +363,10 @@ Provide a comprehensive brand compliance analysis. Output your analysis as JSON:
       );
     }
 
-    const jsonMatch = response.match(/\{[\s\S]*\}/);
-    if (!jsonMatch) {
+    const qaResult = parseJsonObject<VisualQAResult>(response);
+    if (!qaResult) {
       throw new Error("Failed to parse visual QA result JSON");
     }
-
-    const qaResult: VisualQAResult = JSON.parse(jsonMatch[0]);
     qaResult.passed = qaResult.overallScore >= 75;
 
     if (analysisMode === "text") {
@@ -0,0 +1,84 @@
+/**
+ * Helpers for pulling a JSON payload out of an LLM response that may wrap it
+ * in prose or markdown fences.
+ */
+
+function sliceBetween(text: string, open: string, close: string): string | null {
+  const start = text.indexOf(open);
+  if (start === -1) return null;
+  const end = text.lastIndexOf(close);
+  return end > start ? text.slice(start, end + 1) : null;
+}
+
+/**
+ * Index of the bracket closing the one at `start`, or -1 if it never closes.
+ * Brackets inside JSON strings (including escaped quotes) are ignored.
+ */
+function findBalancedEnd(text: string, start: number, open: string, close: string): number {
+  let depth = 0;
+  let inString = false;
+  let escaped = false;
+
+  for (let i = start; i < text.length; i++) {
+    const ch = text[i];
+    if (inString) {
+      if (escaped) {
+        escaped = false;
+      } else if (ch === '\\') {
+        escaped = true;
+      } else if (ch === '"') {
+        inString = false;
+      }
+      continue;
+    }
+    if (ch === '"') {
+      inString = true;
+    } else if (ch === open) {
+      depth++;
+    } else if (ch === close) {
+      depth--;
+      if (depth === 0) return i;
+    }
+  }
+  return -1;
+}
+
+function parseJsonSpan(text: string, open: string, close: string): any {
+  const json = sliceBetween(text, open, close);
+  if (json === null) return null;
+
+  try {
+    return JSON.parse(json);
+  } catch (error) {
+    // The widest span can pick up a stray closing bracket from trailing prose.
+    // Recover only when the first balanced value is the sole bracketed value in
+    // the text; otherwise an earlier citation or example could be mistaken for
+    // the payload, so surface the original parse error instead.
+    const start = text.indexOf(open);
+    const end = findBalancedEnd(text, start, open, close);
+    if (end !== -1 && text.indexOf(open, end + 1) === -1) {
+      try {
+        return JSON.parse(text.slice(start, end + 1));
+      } catch {
+        // Fall through to the widest-span error
+      }
+    }
+    throw error;
+  }
+}
+
+/**
+ * Parse the `{...}` payload spanning the first `{` to the last `}` in the text.
+ * Returns null when the text has no braces; throws if the payload is not valid JSON.
+ */
+export function parseJsonObject<T = any>(text: string): T | null {
+  return parseJsonSpan(text, '{', '}');
+}
+
+/**
+ * Parse the `[...]` payload spanning the first `[` to the last `]` in the text.
+ * Returns null when the text has no brackets; throws if the payload is not valid JSON.
+ */
+export function parseJsonArray<T = any>(text: string): T[] | null {
+  return parseJsonSpan(text, '[', ']');
+}
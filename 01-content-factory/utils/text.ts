@@ -0,0 +1,6 @@
+/**
+ * Shorten text to maxLen characters, marking the cut with '...'.
+ */
+export function truncateText(text: string, maxLen: number): string {
+  return text.length > maxLen ? text.substring(0, maxLen) + '...' : text;
+}
@@ -5,6 +5,7 @@ import { insertApprovalQueueSchema, insertKpiSchema, insertPodSchema, insertPhas
 import { fromError } from "zod-validation-error";
 import { runContentPipeline } from "../01-content-factory/orchestrator";
 import type { ClientBrief, ContentType } from "../01-content-factory/types";
+import { parseJsonObject } from "../01-content-factory/utils/json-extract";
 import multer from "multer";
 import path from "path";
 import fs from "fs";
@@ -524,10 +525,8 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
       // Parse the JSON from Claude's response
       let brandProfile;
       try {
-        const jsonMatch = claudeResponse.match(/\{[\s\S]*\}/);
-        if (jsonMatch) {
-          brandProfile = JSON.parse(jsonMatch[0]);
-        } else {
+        brandProfile = parseJsonObject(claudeResponse);
+        if (!brandProfile) {
           throw new Error('No valid JSON found in response');
         }
       } catch (parseErr: any) {
@@ -133,25 +133,26 @@ const API_ENDPOINTS_TO_TEST = [
   { name: 'Test Feature Health', path: '/api/tests/feature-health', category: 'testing', method: 'GET' },
 ];
 
+// Checked in order; the first substring found in the lowercased error wins
+const SUGGESTED_FIXES: Array<[string, (feature: string) => string]> = [
+  ['401', feature => `Verify authentication for ${feature}`],
+  ['403', feature => `Check authorization permissions for ${feature}`],
+  ['500', feature => `Check server logs for ${feature} - possible backend error`],
+  ['502', feature => `Check if backend service is running for ${feature}`],
+  ['503', feature => `Service unavailable - check provider status for ${feature}`],
+  ['timeout', feature => `Check if ${feature} component is rendering correctly and API is responding`],
+  ['not found', feature => `Verify ${feature} route is registered and component exists`],
+  ['network', feature => `Check API endpoint connectivity for ${feature}`],
+  ['element', feature => `Verify data-testid attributes exist for ${feature} elements`],
+  ['econnrefused', () => `Server not running - start the application first`],
+  ['fetch failed', () => `Network error - verify server is accessible`],
+];
+
 function suggestFix(error: string, feature: string): string {
-  const fixes: Record<string, string> = {
-    'timeout': `Check if ${feature} component is rendering correctly and API is responding`,
-    'not found': `Verify ${feature} route is registered and component exists`,
-    'network': `Check API endpoint connectivity for ${feature}`,
-    '401': `Verify authentication for ${feature}`,
-    '403': `Check authorization permissions for ${feature}`,
-    '500': `Check server logs for ${feature} - possible backend error`,
-    '502': `Check if backend service is running for ${feature}`,
-    '503': `Service unavailable - check provider status for ${feature}`,
-    'element': `Verify data-testid attributes exist for ${feature} elements`,
-    'econnrefused': `Server not running - start the application first`,
-    'fetch failed': `Network error - verify server is accessible`,
-  };
-  
   const lowerError = error.toLowerCase();
-  for (const [key, fix] of Object.entries(fixes)) {
+  for (const [key, fix] of SUGGESTED_FIXES) {
     if (lowerError.includes(key)) {
-      return fix;
+      return fix(feature);
     }
   }
   
@@ -163,7 +164,27 @@ function generateRunId(): string {
 }
 
 let lastTestRun: TestRunResult | null = null;
-let testHistory: TestRunResult[] = [];
+
+// Fixed-size ring buffer of recent runs; newest entry sits just before testHistoryHead
+const TEST_HISTORY_SIZE = 50;
+const testHistory: Array<TestRunResult | undefined> = new Array(TEST_HISTORY_SIZE);
+let testHistoryHead = 0;
+let testHistoryCount = 0;
+
+function recordTestRun(run: TestRunResult): void {
+  testHistory[testHistoryHead] = run;
+  testHistoryHead = (testHistoryHead + 1) % TEST_HISTORY_SIZE;
+  testHistoryCount = Math.min(testHistoryCount + 1, TEST_HISTORY_SIZE);
+}
+
+function getRecentTestRuns(limit: number): TestRunResult[] {
+  const count = Math.min(Math.max(limit, 0), testHistoryCount);
+  const runs: TestRunResult[] = [];
+  for (let i = 1; i <= count; i++) {
+    runs.push(testHistory[(testHistoryHead - i + TEST_HISTORY_SIZE) % TEST_HISTORY_SIZE]!);
+  }
+  return runs;
+}
 
 export function registerTestRoutes(app: Express) {
   app.get('/api/tests/run', async (req, res) => {
@@ -327,10 +348,7 @@ export function registerTestRoutes(app: Express) {
     };
 
     lastTestRun = testRun;
-    testHistory.unshift(testRun);
-    if (testHistory.length > 50) {
-      testHistory = testHistory.slice(0, 50);
-    }
+    recordTestRun(testRun);
 
     console.log(`[Test Runner] Test run ${runId} complete: ${passed}/${results.length} passed (${testRun.summary.passRate.toFixed(1)}%)`);
 
@@ -348,8 +366,8 @@ export function registerTestRoutes(app: Express) {
   app.get('/api/tests/history', (req, res) => {
     const limit = parseInt(req.query.limit as string) || 10;
     res.json({
-      runs: testHistory.slice(0, limit),
-      total: testHistory.length,
+      runs: getRecentTestRuns(limit),
+      total: testHistoryCount,
     });
   });
 
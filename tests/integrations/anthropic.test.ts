@@ -0,0 +1,93 @@
+/**
+ * Anthropic Integration Tests
+ * Covers: low-temperature response cache and temperature forwarding
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+
+const { createMock } = vi.hoisted(() => ({ createMock: vi.fn() }));
+
+vi.mock('@anthropic-ai/sdk', () => ({
+  default: class {
+    messages = { create: createMock };
+  },
+}));
+
+type AnthropicModule = typeof import('../../01-content-factory/integrations/anthropic');
+
+let generateWithClaude: AnthropicModule['generateWithClaude'];
+let generateWithClaudeVision: AnthropicModule['generateWithClaudeVision'];
+
+describe('generateWithClaude response cache', () => {
+  beforeEach(async () => {
+    createMock.mockReset();
+    createMock.mockImplementation(async ({ messages }) => ({
+      content: [{ type: 'text', text: `reply to ${messages[0].content}` }],
+    }));
+    // The cache lives at module level; load a fresh copy for each test
+    vi.resetModules();
+    ({ generateWithClaude, generateWithClaudeVision } = await import('../../01-content-factory/integrations/anthropic'));
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('should serve a repeated low-temperature call from the cache', async () => {
+    const first = await generateWithClaude('system', 'score this', { temperature: 0.2 });
+    const second = await generateWithClaude('system', 'score this', { temperature: 0.2 });
+
+    expect(second).toBe(first);
+    expect(createMock).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not cache calls above the temperature threshold', async () => {
+    await generateWithClaude('system', 'write a post', { temperature: 0.7 });
+    await generateWithClaude('system', 'write a post', { temperature: 0.7 });
+
+    expect(createMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('should not cache calls without an explicit temperature', async () => {
+    await generateWithClaude('system', 'parse guidelines');
+    await generateWithClaude('system', 'parse guidelines');
+
+    expect(createMock).toHaveBeenCalledTimes(2);
+    expect(createMock.mock.calls[0][0]).not.toHaveProperty('temperature');
+  });
+
+  it('should expire cached responses after the TTL', async () => {
+    vi.useFakeTimers();
+    await generateWithClaude('system', 'score this', { temperature: 0 });
+
+    vi.advanceTimersByTime(10 * 60 * 1000 - 1);
+    await generateWithClaude('system', 'score this', { temperature: 0 });
+    expect(createMock).toHaveBeenCalledTimes(1);
+
+    vi.advanceTimersByTime(1);
+    await generateWithClaude('system', 'score this', { temperature: 0 });
+    expect(createMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('should evict the least recently used entry beyond 200 entries', async () => {
+    for (let i = 0; i < 200; i++) {
+      await generateWithClaude('system', `prompt ${i}`, { temperature: 0 });
+    }
+    // Touch prompt 0 so prompt 1 becomes the oldest entry
+    await generateWithClaude('system', 'prompt 0', { temperature: 0 });
+    expect(createMock).toHaveBeenCalledTimes(200);
+
+    await generateWithClaude('system', 'prompt 200', { temperature: 0 });
+    await generateWithClaude('system', 'prompt 0', { temperature: 0 });
+    expect(createMock).toHaveBeenCalledTimes(201);
+
+    await generateWithClaude('system', 'prompt 1', { temperature: 0 });
+    expect(createMock).toHaveBeenCalledTimes(202);
+  });
+
+  it('should forward temperature on vision calls', async () => {
+    await generateWithClaudeVision('system', 'describe', [{ base64: 'iVBORw0KGgo=' }], { temperature: 0.3 });
+
+    expect(createMock.mock.calls[0][0]).toMatchObject({ temperature: 0.3 });
+  });
+});
@@ -0,0 +1,67 @@
+/**
+ * JSON Extraction Tests
+ * Covers: pulling JSON payloads out of LLM responses
+ */
+
+import { describe, it, expect } from 'vitest';
+import { parseJsonObject, parseJsonArray } from '../../01-content-factory/utils/json-extract';
+
+describe('parseJsonObject', () => {
+  it('should parse an object wrapped in prose and code fences', () => {
+    const text = 'Here is the review:\n```json\n{"score": 82, "passed": true}\n```\nLet me know!';
+    expect(parseJsonObject(text)).toEqual({ score: 82, passed: true });
+  });
+
+  it('should ignore braces inside strings', () => {
+    const text = 'Result: {"feedback": "Use {brand} and \\"quotes\\" }", "score": 70}';
+    expect(parseJsonObject(text)).toEqual({ feedback: 'Use {brand} and "quotes" }', score: 70 });
+  });
+
+  it('should recover from a stray closing brace after the payload', () => {
+    const text = '{"score": 82, "passed": true}\nNote: close every } you open.';
+    expect(parseJsonObject(text)).toEqual({ score: 82, passed: true });
+  });
+
+  it('should not mistake an example object for the payload', () => {
+    const text = 'Scores use the {"min": 0} scale. {"score": 82, "passed": true}';
+    expect(() => parseJsonObject(text)).toThrow();
+  });
+
+  it('should not mistake a placeholder for the payload', () => {
+    const text = 'Return {} if unsure.\n{"score": 82, "passed": true} done';
+    expect(() => parseJsonObject(text)).toThrow();
+  });
+
+  it('should return null when there is no object', () => {
+    expect(parseJsonObject('No JSON here')).toBeNull();
+  });
+
+  it('should throw on a malformed payload', () => {
+    expect(() => parseJsonObject('{"score": 82,}')).toThrow();
+  });
+
+  it('should throw on a malformed payload followed by another object', () => {
+    expect(() => parseJsonObject('{"score": 82,} trailing {"ok":1}')).toThrow();
+  });
+});
+
+describe('parseJsonArray', () => {
+  it('should parse an array wrapped in prose', () => {
+    const text = 'Topics:\n[{"title": "A"}, {"title": "B"}]\nDone.';
+    expect(parseJsonArray(text)).toEqual([{ title: 'A' }, { title: 'B' }]);
+  });
+
+  it('should not mistake a count in the prose for the payload', () => {
+    const text = 'Here are the [5] topics you asked for:\n[{"title": "A"}, {"title": "B"}]';
+    expect(() => parseJsonArray(text)).toThrow();
+  });
+
+  it('should not mistake a citation marker for the payload', () => {
+    const text = 'Topics (see [1]):\n```json\n[{"title": "A"}]\n```';
+    expect(() => parseJsonArray(text)).toThrow();
+  });
+
+  it('should return null when there is no array', () => {
+    expect(parseJsonArray('{"title": "A"}')).toBeNull();
+  });
+});